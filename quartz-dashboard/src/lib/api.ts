@@ -2,13 +2,20 @@
 
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || 'https://api.quartzdb.io';
 
+// Server-side limit for /api/vector/batch-insert
+const MAX_BATCH_SIZE = 100;
+
 export interface VectorSearchResult {
   id: string;
   score: number;
   distance: number;
   metadata?: Record<string, unknown>;
+  vector?: number[];
 }
 
+// Optional per-result fields; omitted => ['metadata']
+export type SearchInclude = 'metadata' | 'vector';
+
 export interface SearchResponse {
   success: boolean;
   results: VectorSearchResult[];
@@ -16,6 +23,19 @@ export interface SearchResponse {
   algorithm: string;
 }
 
+export interface SearchQuery {
+  vector: number[];
+  k?: number;
+  include?: SearchInclude[];
+}
+
+export interface BatchSearchResponse {
+  success: boolean;
+  results: VectorSearchResult[][];
+  count: number;
+  algorithm: string;
+}
+
 export interface StatsResponse {
   success: boolean;
   num_vectors: number;
@@ -33,6 +53,20 @@ export interface InsertResponse {
   message: string;
 }
 
+export interface BatchInsertItem {
+  id: string;
+  vector: number[];
+  metadata?: Record<string, unknown>;
+}
+
+export interface BatchInsertResponse {
+  success: boolean;
+  total: number;
+  inserted: number;
+  failed: number;
+  results: { id: string; success: boolean; message: string }[];
+}
+
 export interface HealthResponse {
   status: string;
   service: string;
@@ -44,6 +78,33 @@ export interface HealthResponse {
   };
 }
 
+// Symmetric per-vector quantization: q = round(x / scale), scale = max|x| / 127
+export function quantizeInt8(vector: ArrayLike<number>): { data: Int8Array<ArrayBuffer>; scale: number } {
+  let absMax = 0;
+  for (let i = 0; i < vector.length; i++) {
+    absMax = Math.max(absMax, Math.abs(vector[i]));
+  }
+
+  const scale = absMax > 0 ? absMax / 127 : 1;
+  const data = new Int8Array(vector.length);
+  for (let i = 0; i < vector.length; i++) {
+    data[i] = Math.round(vector[i] / scale);
+  }
+
+  return { data, scale };
+}
+
+// Non-2xx response; `status` lets callers branch without parsing the message
+export class ApiError extends Error {
+  constructor(
+    message: string,
+    public readonly status: number
+  ) {
+    super(message);
+    this.name = 'ApiError';
+  }
+}
+
 class QuartzAPI {
   private apiKey: string = '';
 
@@ -72,7 +133,7 @@ class QuartzAPI {
 
     if (!response.ok) {
       const text = await response.text();
-      throw new Error(text || `HTTP ${response.status}`);
+      throw new ApiError(text || `HTTP ${response.status}`, response.status);
     }
 
     return response.json();
@@ -86,13 +147,35 @@ class QuartzAPI {
     return this.fetch<StatsResponse>('/api/vector/stats');
   }
 
-  async search(vector: number[], k: number = 10): Promise<SearchResponse> {
+  async search(vector: number[], k: number = 10, include?: SearchInclude[]): Promise<SearchResponse> {
     return this.fetch<SearchResponse>('/api/vector/search', {
       method: 'POST',
-      body: JSON.stringify({ vector, k }),
+      body: JSON.stringify({ vector, k, include }),
     });
   }
 
+  // One round-trip for all queries; results[i] answers queries[i]
+  async searchBatch(queries: SearchQuery[]): Promise<BatchSearchResponse> {
+    try {
+      return await this.fetch<BatchSearchResponse>('/api/vector/search-batch', {
+        method: 'POST',
+        body: JSON.stringify({ queries }),
+      });
+    } catch (err) {
+      // Older servers without the batch endpoint: fan out concurrently instead
+      if (!(err instanceof ApiError) || err.status !== 404) {
+        throw err;
+      }
+      const responses = await Promise.all(queries.map((q) => this.search(q.vector, q.k ?? 10, q.include)));
+      return {
+        success: responses.every((r) => r.success),
+        results: responses.map((r) => r.results),
+        count: responses.length,
+        algorithm: 'HNSW',
+      };
+    }
+  }
+
   async insert(id: string, vector: number[], metadata?: Record<string, unknown>): Promise<InsertResponse> {
     return this.fetch<InsertResponse>('/api/vector/insert', {
       method: 'POST',
@@ -100,10 +183,88 @@ class QuartzAPI {
     });
   }
 
+  // Raw little-endian float32 body: ~3x smaller than JSON and no float parsing on the server
+  async insertBinary(id: string, vector: Float32Array<ArrayBuffer>, metadata?: Record<string, unknown>): Promise<InsertResponse> {
+    return this.postBinary(id, vector, vector.length, {}, metadata);
+  }
+
+  // int8 + absmax scale: 4x smaller again than float32 (384 bytes for 384 dims)
+  async insertInt8(id: string, vector: ArrayLike<number>, metadata?: Record<string, unknown>): Promise<InsertResponse> {
+    const { data, scale } = quantizeInt8(vector);
+    return this.postBinary(id, data, data.length, {
+      'X-Vector-Dtype': 'int8',
+      'X-Vector-Scale': String(scale),
+    }, metadata);
+  }
+
+  private async postBinary(
+    id: string,
+    body: ArrayBufferView<ArrayBuffer>,
+    dimension: number,
+    extraHeaders: Record<string, string>,
+    metadata?: Record<string, unknown>
+  ): Promise<InsertResponse> {
+    const headers: Record<string, string> = {
+      'Content-Type': 'application/octet-stream',
+      'X-Vector-Id': id,
+      'X-Vector-Dim': String(dimension),
+      ...extraHeaders,
+    };
+
+    if (metadata) {
+      // Header values must be ASCII; \u-escape anything else (still valid JSON)
+      headers['X-Metadata'] = JSON.stringify(metadata).replace(
+        /[\u007f-\uffff]/g,
+        (c) => '\\u' + c.charCodeAt(0).toString(16).padStart(4, '0')
+      );
+    }
+
+    return this.fetch<InsertResponse>('/api/vector/insert-binary', {
+      method: 'POST',
+      body,
+      headers,
+    });
+  }
+
+  // Sends items in chunks of MAX_BATCH_SIZE: one request per chunk instead of one per vector
+  async batchInsert(items: BatchInsertItem[]): Promise<BatchInsertResponse> {
+    const merged: BatchInsertResponse = { success: true, total: 0, inserted: 0, failed: 0, results: [] };
+
+    for (let i = 0; i < items.length; i += MAX_BATCH_SIZE) {
+      const res = await this.fetch<BatchInsertResponse>('/api/vector/batch-insert', {
+        method: 'POST',
+        body: JSON.stringify({ vectors: items.slice(i, i + MAX_BATCH_SIZE) }),
+      });
+      merged.success = merged.success && res.success;
+      merged.total += res.total;
+      merged.inserted += res.inserted;
+      merged.failed += res.failed;
+      merged.results.push(...res.results);
+    }
+
+    return merged;
+  }
+
   async getVector(id: string): Promise<{ id: string; vector: number[]; metadata?: Record<string, unknown> }> {
     return this.fetch(`/api/vector/get/${encodeURIComponent(id)}`);
   }
 
+  // HEAD: status only, the vector itself is never transferred
+  async vectorExists(id: string): Promise<boolean> {
+    const response = await fetch(`${API_BASE}/api/vector/get/${encodeURIComponent(id)}`, {
+      method: 'HEAD',
+      headers: this.apiKey ? { 'X-API-Key': this.apiKey } : {},
+    });
+
+    if (response.status === 404) {
+      return false;
+    }
+    if (!response.ok) {
+      throw new Error(`HTTP ${response.status}`);
+    }
+    return true;
+  }
+
   async deleteVector(id: string): Promise<{ success: boolean; message: string }> {
     return this.fetch('/api/vector/delete', {
       method: 'DELETE',
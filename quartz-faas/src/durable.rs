@@ -32,7 +32,7 @@
 //! - **Purpose**: HNSW-based vector search
 //! - **Algorithm**: O(log n) approximate nearest neighbor
 //! - **Persistence**: Serialized HNSW graph to SQLite
-//! - **Operations**: INSERT, SEARCH, DELETE, STATS, CONFIG
+//! - **Operations**: INSERT, GET/HEAD, SEARCH, SEARCH-BATCH, DELETE, STATS, CONFIG
 //!
 //! # Performance Characteristics
 //!
@@ -282,7 +282,8 @@ impl StorageObject {
 // - Single-threaded WASM environment guarantees thread safety
 //
 
-use crate::vector::{HnswIndex, DistanceMetric, HnswConfig};
+use crate::vector::{HnswIndex, DistanceMetric, HnswConfig, QueryCache, CachedHits};
+use crate::validation::{decode_vector_body, SearchInclude, MAX_BATCH_SIZE};
 
 #[durable_object]
 pub struct VectorIndexObject {
@@ -314,6 +315,9 @@ pub struct VectorIndexObject {
     // ========================================================================
     dirty: RefCell<bool>,
     alarm_scheduled: RefCell<bool>,
+
+    // Search results for recent queries; cleared on every index mutation
+    query_cache: RefCell<QueryCache>,
 }
 
 impl DurableObject for VectorIndexObject {
@@ -324,6 +328,7 @@ impl DurableObject for VectorIndexObject {
             initialized: RefCell::new(false),
             dirty: RefCell::new(false),
             alarm_scheduled: RefCell::new(false),
+            query_cache: RefCell::new(QueryCache::default()),
         }
     }
 
@@ -342,12 +347,18 @@ impl DurableObject for VectorIndexObject {
 
         match (method, path) {
             (Method::Post, "/insert") => self.handle_insert(req).await,
+            (Method::Post, "/insert-binary") => self.handle_insert_binary(req).await,
             (Method::Post, "/batch-insert") => self.handle_batch_insert(req).await,
             (Method::Post, "/search") => self.handle_search(req).await,
+            (Method::Post, "/search-batch") => self.handle_search_batch(req).await,
             (Method::Get, path) if path.starts_with("/get/") => {
                 let id = path.strip_prefix("/get/").unwrap_or("");
                 self.handle_get(id).await
             }
+            (Method::Head, path) if path.starts_with("/get/") => {
+                let id = path.strip_prefix("/get/").unwrap_or("");
+                self.handle_exists(id)
+            }
             (Method::Delete, path) if path.starts_with("/delete/") => {
                 let id = path.strip_prefix("/delete/").unwrap_or("");
                 self.handle_delete(id).await
@@ -516,13 +527,67 @@ impl VectorIndexObject {
             return Response::error("Vector cannot be empty", 400);
         }
 
+        self.insert_vector(body.id, body.vector, body.metadata).await
+    }
+
+    /// Insert a vector sent as raw little-endian f32 (or int8) bytes
+    ///
+    /// **Request:**
+    /// ```text
+    /// Content-Type: application/octet-stream
+    /// X-Vector-Id: vec1
+    /// X-Vector-Dtype: int8            (optional, default float32)
+    /// X-Vector-Scale: 0.0071          (required for int8)
+    /// X-Metadata: {"title": "..."}   (optional, JSON)
+    ///
+    /// <dimension × 4 bytes>  (float32)
+    /// <dimension × 1 byte>   (int8, value = byte × scale)
+    /// ```
+    ///
+    /// **Performance:**
+    /// - float32: ~3x smaller payload than JSON (1.5KB vs ~4.6KB for 384 dims)
+    /// - int8: another 4x smaller (384 bytes); dequantized here, stored as f32
+    /// - No decimal float parsing; decode is a straight byte reinterpretation
+    async fn handle_insert_binary(&self, mut req: Request) -> Result<Response> {
+        let id = req.headers().get("X-Vector-Id")?.unwrap_or_default();
+        if id.is_empty() {
+            return Response::error("ID cannot be empty", 400);
+        }
+
+        let metadata = match req.headers().get("X-Metadata")? {
+            Some(raw) => match serde_json::from_str::<serde_json::Value>(&raw) {
+                Ok(m) => Some(m),
+                Err(_) => return Response::error("Invalid X-Metadata JSON", 400),
+            },
+            None => None,
+        };
+
+        let dtype = req.headers().get("X-Vector-Dtype")?;
+        let scale = req.headers().get("X-Vector-Scale")?;
+        let bytes = req.bytes().await?;
+        let vector = match decode_vector_body(&bytes, dtype.as_deref(), scale.as_deref()) {
+            Ok(v) if !v.is_empty() => v,
+            Ok(_) => return Response::error("Vector cannot be empty", 400),
+            Err(e) => return Response::error(&e.to_string(), 400),
+        };
+
+        self.insert_vector(id, vector, metadata).await
+    }
+
+    /// Shared insert path for JSON and binary requests
+    async fn insert_vector(
+        &self,
+        id: String,
+        vector: Vec<f32>,
+        metadata: Option<serde_json::Value>,
+    ) -> Result<Response> {
         // Insert into HNSW index
         // CRITICAL: Limit borrow_mut() scope to prevent double-borrow panic
         // The mutable borrow MUST be dropped before calling persist_index()
         // which internally calls self.index.borrow() (immutable borrow)
         let insert_result = {
             if let Some(index) = self.index.borrow_mut().as_mut() {
-                index.insert(body.id.clone(), body.vector, body.metadata)
+                index.insert(id.clone(), vector, metadata)
             } else {
                 return Response::error("Index not initialized", 500);
             }
@@ -530,6 +595,8 @@ impl VectorIndexObject {
 
         match insert_result {
             Ok(_) => {
+                self.query_cache.borrow_mut().clear();
+
                 // Mark dirty and schedule alarm if not already scheduled
                 *self.dirty.borrow_mut() = true;
                 
@@ -539,11 +606,14 @@ impl VectorIndexObject {
                     console_log!("Scheduled persistence alarm (10s)");
                 }
                 
-                Response::from_json(&serde_json::json!({
+                // X-Vector-Id lets clients confirm the insert from headers alone
+                let mut response = Response::from_json(&serde_json::json!({
                     "success": true,
-                    "id": body.id,
+                    "id": id,
                     "message": "Vector inserted into HNSW index"
-                }))
+                }))?;
+                response.headers_mut().set("X-Vector-Id", &id)?;
+                Ok(response)
             }
             Err(e) => {
                 Response::error(&format!("Failed to insert vector: {}", e), 400)
@@ -589,8 +659,8 @@ impl VectorIndexObject {
             return Response::error("Vectors array cannot be empty", 400);
         }
 
-        if body.vectors.len() > 100 {
-            return Response::error("Batch too large (max 100 vectors)", 400);
+        if body.vectors.len() > MAX_BATCH_SIZE {
+            return Response::error(&format!("Batch too large (max {} vectors)", MAX_BATCH_SIZE), 400);
         }
 
         // Process batch with single mutable borrow
@@ -601,10 +671,11 @@ impl VectorIndexObject {
                 None => return Response::error("Index not initialized", 500),
             };
 
-            body.vectors.iter().map(|item| {
-                match index.insert(item.id.clone(), item.vector.clone(), item.metadata.clone()) {
-                    Ok(_) => (item.id.clone(), true, "inserted".to_string()),
-                    Err(e) => (item.id.clone(), false, e),
+            // Consume the request: vectors and metadata move into the index
+            body.vectors.into_iter().map(|item| {
+                match index.insert(item.id.clone(), item.vector, item.metadata) {
+                    Ok(_) => (item.id, true, "inserted".to_string()),
+                    Err(e) => (item.id, false, e),
                 }
             }).collect()
         }; // Mutable borrow dropped here
@@ -614,6 +685,7 @@ impl VectorIndexObject {
 
         // Mark dirty and schedule alarm if any inserts succeeded
         if success_count > 0 {
+            self.query_cache.borrow_mut().clear();
             *self.dirty.borrow_mut() = true;
             
             if !*self.alarm_scheduled.borrow() {
@@ -669,11 +741,35 @@ impl VectorIndexObject {
         }
     }
 
+    /// Existence check for HEAD /get/:id
+    ///
+    /// 200 or 404 with an empty body: no vector clone, serialization or
+    /// error payload, so verifying an insert or delete costs only a status line.
+    fn handle_exists(&self, id: &str) -> Result<Response> {
+        let exists = match self.index.borrow().as_ref() {
+            Some(index) => index.contains(id),
+            None => return Response::error("Index not initialized", 500),
+        };
+
+        let status = if exists { 200 } else { 404 };
+        Ok(Response::empty()?.with_status(status))
+    }
+
+    /// k-NN search
+    ///
+    /// Optional `"include"` selects per-result fields beyond id/distance/score:
+    /// `["metadata"]` (the default), `["vector"]`, both, or `[]` for the
+    /// smallest response.
+    ///
+    /// `"cache": false` bypasses the query cache (latency benchmarks use it
+    /// so repeated queries still measure the graph search).
     async fn handle_search(&self, mut req: Request) -> Result<Response> {
         #[derive(Deserialize)]
         struct SearchRequest {
             vector: Vec<f32>,
             k: Option<usize>,
+            include: Option<serde_json::Value>,
+            cache: Option<bool>,
         }
 
         let body = match req.json::<SearchRequest>().await {
@@ -687,20 +783,17 @@ impl VectorIndexObject {
 
         let k = body.k.unwrap_or(10).min(100); // Max 100 results
 
+        let include = match SearchInclude::parse(body.include.as_ref()) {
+            Ok(inc) => inc,
+            Err(e) => return Response::error(&e.to_string(), 400),
+        };
+
         // Search using HNSW index
         if let Some(index) = self.index.borrow().as_ref() {
-            match index.search(&body.vector, k) {
-                Ok(results) => {
-                    let results_json: Vec<_> = results
-                        .into_iter()
-                        .map(|r| {
-                            serde_json::json!({
-                                "id": r.id,
-                                "distance": r.distance,
-                                "score": 1.0 - r.distance, // Convert distance to similarity
-                                "metadata": r.metadata
-                            })
-                        })
+            match self.search_cached(index, &body.vector, k, body.cache.unwrap_or(true)) {
+                Ok(hits) => {
+                    let results_json: Vec<_> = hits.into_iter()
+                        .map(|(id, distance)| search_result_json(id, distance, include, index))
                         .collect();
 
                     Response::from_json(&serde_json::json!({
@@ -719,6 +812,108 @@ impl VectorIndexObject {
         }
     }
 
+    /// Run several searches in one request
+    ///
+    /// **Request:**
+    /// ```json
+    /// {
+    ///   "queries": [
+    ///     {"vector": [0.1, 0.2, ...], "k": 3},
+    ///     {"vector": [0.3, 0.4, ...], "k": 3}
+    ///   ]
+    /// }
+    /// ```
+    ///
+    /// **Response:** `results[i]` holds the matches for `queries[i]`.
+    ///
+    /// **Performance:**
+    /// - One HTTP round-trip and one Worker → DO hop for all queries
+    /// - Single index borrow; each query goes through the query cache unless
+    ///   it sets `"cache": false`
+    async fn handle_search_batch(&self, mut req: Request) -> Result<Response> {
+        #[derive(Deserialize)]
+        struct Query {
+            vector: Vec<f32>,
+            k: Option<usize>,
+            include: Option<serde_json::Value>,
+            cache: Option<bool>,
+        }
+
+        #[derive(Deserialize)]
+        struct BatchSearchRequest {
+            queries: Vec<Query>,
+            /// Default for queries without their own `include`
+            include: Option<serde_json::Value>,
+        }
+
+        let body = match req.json::<BatchSearchRequest>().await {
+            Ok(b) => b,
+            Err(e) => return Response::error(&format!("Invalid JSON body: {}", e), 400),
+        };
+
+        if body.queries.is_empty() {
+            return Response::error("Queries array cannot be empty", 400);
+        }
+
+        if body.queries.len() > MAX_BATCH_SIZE {
+            return Response::error(&format!("Batch too large (max {} queries)", MAX_BATCH_SIZE), 400);
+        }
+
+        let index_guard = self.index.borrow();
+        let index = match index_guard.as_ref() {
+            Some(idx) => idx,
+            None => return Response::error("Index not initialized", 500),
+        };
+
+        let mut all_results = Vec::with_capacity(body.queries.len());
+        for (i, query) in body.queries.iter().enumerate() {
+            let k = query.k.unwrap_or(10).min(100); // Max 100 results per query
+            let include = match SearchInclude::parse(query.include.as_ref().or(body.include.as_ref())) {
+                Ok(inc) => inc,
+                Err(e) => return Response::error(&format!("Query {}: {}", i, e), 400),
+            };
+            match self.search_cached(index, &query.vector, k, query.cache.unwrap_or(true)) {
+                Ok(hits) => {
+                    all_results.push(hits.into_iter()
+                        .map(|(id, distance)| search_result_json(id, distance, include, index))
+                        .collect::<Vec<_>>());
+                }
+                Err(e) => {
+                    return Response::error(&format!("Search failed for query {}: {}", i, e), 500);
+                }
+            }
+        }
+
+        Response::from_json(&serde_json::json!({
+            "success": true,
+            "results": all_results,
+            "count": all_results.len(),
+            "algorithm": "HNSW"
+        }))
+    }
+
+    /// Search through the query cache: repeated queries skip the graph
+    ///
+    /// Returns ranked `(id, distance)` pairs; callers read metadata from the
+    /// index while building the response. `use_cache = false` neither reads
+    /// nor fills the cache.
+    fn search_cached(&self, index: &HnswIndex, query: &[f32], k: usize, use_cache: bool) -> std::result::Result<CachedHits, String> {
+        if use_cache {
+            if let Some(hits) = self.query_cache.borrow_mut().get(query, k) {
+                return Ok(hits);
+            }
+        }
+
+        let hits: CachedHits = index.search(query, k)?
+            .into_iter()
+            .map(|r| (r.id, r.distance))
+            .collect();
+        if use_cache {
+            self.query_cache.borrow_mut().insert(query, k, hits.clone());
+        }
+        Ok(hits)
+    }
+
     /// Handle vector deletion request using soft-delete strategy
     ///
     /// # Soft Delete Implementation
@@ -774,6 +969,8 @@ impl VectorIndexObject {
 
         match delete_result {
             Ok(true) => {
+                self.query_cache.borrow_mut().clear();
+
                 // Mark dirty and schedule alarm if not already scheduled
                 *self.dirty.borrow_mut() = true;
                 
@@ -804,6 +1001,9 @@ impl VectorIndexObject {
     }
 
     async fn handle_stats(&self) -> Result<Response> {
+        let cache = self.query_cache.borrow();
+        let (cache_hits, cache_misses) = cache.hit_stats();
+
         if let Some(index) = self.index.borrow().as_ref() {
             let stats = index.stats();
             
@@ -836,7 +1036,12 @@ impl VectorIndexObject {
                 "num_nodes": stats.num_nodes,
                 "dimension": stats.dimension,
                 "entry_point_level": stats.entry_point_level,
-                "connections_per_layer": stats.connections_per_layer
+                "connections_per_layer": stats.connections_per_layer,
+                "query_cache": {
+                    "entries": cache.len(),
+                    "hits": cache_hits,
+                    "misses": cache_misses
+                }
             }))
         } else {
             Response::from_json(&serde_json::json!({
@@ -904,6 +1109,7 @@ impl VectorIndexObject {
         // Create new index with config
         let new_index = HnswIndex::with_config(dimension, metric, config);
         *self.index.borrow_mut() = Some(new_index);
+        self.query_cache.borrow_mut().clear();
 
         // Persist
         if let Err(e) = self.persist_index().await {
@@ -917,3 +1123,25 @@ impl VectorIndexObject {
         }))
     }
 }
+
+/// JSON shape of a single search hit (shared by single and batch search)
+fn search_result_json(id: String, distance: f32, include: SearchInclude, index: &HnswIndex) -> serde_json::Value {
+    let mut json = serde_json::json!({
+        "id": id,
+        "distance": distance,
+        "score": 1.0 - distance, // Convert distance to similarity
+    });
+
+    if include.metadata {
+        json["metadata"] = serde_json::json!(index.metadata(&id));
+    }
+
+    // Stored form: unit length under the cosine metric
+    if include.vector {
+        if let Some(vector) = index.vector(&id) {
+            json["vector"] = serde_json::json!(vector);
+        }
+    }
+
+    json
+}
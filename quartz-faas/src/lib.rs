@@ -221,7 +221,7 @@ pub async fn main(req: Request, env: Env, _ctx: Context) -> Result<Response> {
             }
         })
         .post_async("/api/put", |mut req, ctx| async move {
-            let body: serde_json::Value = req.json().await?;
+            let body = req.text().await?;
             
             // Get Durable Object stub
             let namespace = ctx.env.durable_object("STORAGE")?;
@@ -232,7 +232,7 @@ pub async fn main(req: Request, env: Env, _ctx: Context) -> Result<Response> {
                 "https://fake-host/put",
                 RequestInit::new()
                     .with_method(Method::Post)
-                    .with_body(Some(serde_json::to_string(&body)?.into()))
+                    .with_body(Some(body.into()))
             )?;
             do_req.headers_mut()?.set("Content-Type", "application/json")?;
             
@@ -278,7 +278,10 @@ pub async fn main(req: Request, env: Env, _ctx: Context) -> Result<Response> {
             }
         })
         .post_async("/api/vector/insert", |mut req, ctx| async move {
-            let body: serde_json::Value = req.json().await?;
+            // Parse for validation only; the original text is forwarded as-is
+            // (re-serializing would re-format every float in the vector)
+            let raw = req.text().await?;
+            let body: serde_json::Value = serde_json::from_str(&raw)?;
             
             // Validate request
             if let Err(e) = validate_insert_request(&body) {
@@ -295,15 +298,62 @@ pub async fn main(req: Request, env: Env, _ctx: Context) -> Result<Response> {
                 "https://fake-host/insert",
                 RequestInit::new()
                     .with_method(Method::Post)
-                    .with_body(Some(serde_json::to_string(&body)?.into()))
+                    .with_body(Some(raw.into()))
             )?;
             do_req.headers_mut()?.set("Content-Type", "application/json")?;
             
             let response = stub.fetch_with_request(do_req).await?;
             Ok(add_cors_headers(response))
         })
+        .post_async("/api/vector/insert-binary", |mut req, ctx| async move {
+            // Binary insert: raw f32 (or int8 + scale) body, ID/metadata in headers
+            let id = req.headers().get("X-Vector-Id")?.unwrap_or_default();
+            let dimension = req.headers().get("X-Vector-Dim")?;
+            let dtype = req.headers().get("X-Vector-Dtype")?;
+            let scale = req.headers().get("X-Vector-Scale")?;
+            let metadata = req.headers().get("X-Metadata")?;
+            let bytes = req.bytes().await?;
+            
+            // Validate request
+            let validation = decode_vector_body(&bytes, dtype.as_deref(), scale.as_deref())
+                .and_then(|vector| {
+                    validate_binary_insert_request(&id, &vector, dimension.as_deref(), metadata.as_deref())
+                });
+            if let Err(e) = validation {
+                return Response::error(&format!("Validation error: {}", e), 400)
+                    .map(|r| add_cors_headers(r));
+            }
+            
+            // Get Vector Index Durable Object stub
+            let namespace = ctx.env.durable_object("VECTOR_INDEX")?;
+            let stub = namespace.id_from_name("default")?.get_stub()?;
+            
+            // Forward the bytes untouched - no JSON round-trip on this hop either
+            let mut do_req = Request::new_with_init(
+                "https://fake-host/insert-binary",
+                RequestInit::new()
+                    .with_method(Method::Post)
+                    .with_body(Some(js_sys::Uint8Array::from(bytes.as_slice()).into()))
+            )?;
+            let headers = do_req.headers_mut()?;
+            headers.set("Content-Type", "application/octet-stream")?;
+            headers.set("X-Vector-Id", &id)?;
+            if let Some(dtype) = &dtype {
+                headers.set("X-Vector-Dtype", dtype)?;
+            }
+            if let Some(scale) = &scale {
+                headers.set("X-Vector-Scale", scale)?;
+            }
+            if let Some(meta) = &metadata {
+                headers.set("X-Metadata", meta)?;
+            }
+            
+            let response = stub.fetch_with_request(do_req).await?;
+            Ok(add_cors_headers(response))
+        })
         .post_async("/api/vector/batch-insert", |mut req, ctx| async move {
-            let body: serde_json::Value = req.json().await?;
+            let raw = req.text().await?;
+            let body: serde_json::Value = serde_json::from_str(&raw)?;
             
             // Validate batch request
             if let Err(e) = validate_batch_insert_request(&body) {
@@ -320,7 +370,7 @@ pub async fn main(req: Request, env: Env, _ctx: Context) -> Result<Response> {
                 "https://fake-host/batch-insert",
                 RequestInit::new()
                     .with_method(Method::Post)
-                    .with_body(Some(serde_json::to_string(&body)?.into()))
+                    .with_body(Some(raw.into()))
             )?;
             do_req.headers_mut()?.set("Content-Type", "application/json")?;
             
@@ -352,8 +402,30 @@ pub async fn main(req: Request, env: Env, _ctx: Context) -> Result<Response> {
                     .map(|r| add_cors_headers(r))
             }
         })
+        .head_async("/api/vector/get/:id", |_, ctx| async move {
+            // Existence check: same status codes as GET, no body
+            if let Some(id) = ctx.param("id") {
+                if validate_vector_id(id).is_err() {
+                    return Ok(add_cors_headers(Response::empty()?.with_status(400)));
+                }
+                
+                let namespace = ctx.env.durable_object("VECTOR_INDEX")?;
+                let stub = namespace.id_from_name("default")?.get_stub()?;
+                
+                let do_req = Request::new_with_init(
+                    &format!("https://fake-host/get/{}", id),
+                    RequestInit::new().with_method(Method::Head)
+                )?;
+                
+                let response = stub.fetch_with_request(do_req).await?;
+                Ok(add_cors_headers(response))
+            } else {
+                Ok(add_cors_headers(Response::empty()?.with_status(400)))
+            }
+        })
         .post_async("/api/vector/search", |mut req, ctx| async move {
-            let body: serde_json::Value = req.json().await?;
+            let raw = req.text().await?;
+            let body: serde_json::Value = serde_json::from_str(&raw)?;
             
             // Validate request
             if let Err(e) = validate_search_request(&body) {
@@ -370,7 +442,33 @@ pub async fn main(req: Request, env: Env, _ctx: Context) -> Result<Response> {
                 "https://fake-host/search",
                 RequestInit::new()
                     .with_method(Method::Post)
-                    .with_body(Some(serde_json::to_string(&body)?.into()))
+                    .with_body(Some(raw.into()))
+            )?;
+            do_req.headers_mut()?.set("Content-Type", "application/json")?;
+            
+            let response = stub.fetch_with_request(do_req).await?;
+            Ok(add_cors_headers(response))
+        })
+        .post_async("/api/vector/search-batch", |mut req, ctx| async move {
+            let raw = req.text().await?;
+            let body: serde_json::Value = serde_json::from_str(&raw)?;
+            
+            // Validate batch request
+            if let Err(e) = validate_batch_search_request(&body) {
+                return Response::error(&format!("Validation error: {}", e), 400)
+                    .map(|r| add_cors_headers(r));
+            }
+            
+            // Get Vector Index Durable Object stub
+            let namespace = ctx.env.durable_object("VECTOR_INDEX")?;
+            let stub = namespace.id_from_name("default")?.get_stub()?;
+            
+            // Forward request to Durable Object
+            let mut do_req = Request::new_with_init(
+                "https://fake-host/search-batch",
+                RequestInit::new()
+                    .with_method(Method::Post)
+                    .with_body(Some(raw.into()))
             )?;
             do_req.headers_mut()?.set("Content-Type", "application/json")?;
             
@@ -445,14 +543,17 @@ fn add_cors_headers(mut response: Response) -> Response {
     let _ = headers.set("Access-Control-Allow-Origin", "*");
     
     // Allow common methods
-    let _ = headers.set("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS");
+    let _ = headers.set("Access-Control-Allow-Methods", "GET, HEAD, POST, PUT, DELETE, OPTIONS");
     
     // Allow common headers
     let _ = headers.set(
         "Access-Control-Allow-Headers",
-        "Content-Type, Authorization, X-API-Key"
+        "Content-Type, Authorization, X-API-Key, X-Vector-Id, X-Vector-Dim, X-Vector-Dtype, X-Vector-Scale, X-Metadata"
     );
     
+    // Let browser clients read the inserted ID without parsing the body
+    let _ = headers.set("Access-Control-Expose-Headers", "X-Vector-Id");
+    
     // Cache preflight for 24 hours
     let _ = headers.set("Access-Control-Max-Age", "86400");
     
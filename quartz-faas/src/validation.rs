@@ -14,6 +14,7 @@
 //!
 //! All validations return descriptive errors for API responses
 
+use serde::Deserialize;
 use serde_json::Value;
 use worker::*;
 
@@ -94,7 +95,7 @@ pub fn validate_vector(vector: &[f32]) -> Result<()> {
 /// - Optional (can be null)
 /// - Must be valid JSON object
 /// - Max 32KB when serialized
-pub fn validate_metadata(metadata: &Option<Value>) -> Result<()> {
+pub fn validate_metadata(metadata: Option<&Value>) -> Result<()> {
     if let Some(meta) = metadata {
         // Must be an object or null
         if !meta.is_object() && !meta.is_null() {
@@ -103,11 +104,12 @@ pub fn validate_metadata(metadata: &Option<Value>) -> Result<()> {
             ));
         }
         
-        // Check size
-        let serialized = serde_json::to_string(meta)
+        // Check size (counted while serializing - no String is built)
+        let mut size = ByteCounter(0);
+        serde_json::to_writer(&mut size, meta)
             .map_err(|e| Error::RustError(format!("Invalid metadata JSON: {}", e)))?;
         
-        if serialized.len() > MAX_METADATA_SIZE {
+        if size.0 > MAX_METADATA_SIZE {
             return Err(Error::RustError(
                 format!("Metadata too large (max {} bytes)", MAX_METADATA_SIZE)
             ));
@@ -117,6 +119,20 @@ pub fn validate_metadata(metadata: &Option<Value>) -> Result<()> {
     Ok(())
 }
 
+/// `io::Write` sink that only counts bytes
+struct ByteCounter(usize);
+
+impl std::io::Write for ByteCounter {
+    fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
+        self.0 += buf.len();
+        Ok(buf.len())
+    }
+    
+    fn flush(&mut self) -> std::io::Result<()> {
+        Ok(())
+    }
+}
+
 /// Validate search k parameter
 ///
 /// Rules:
@@ -165,15 +181,13 @@ pub fn validate_insert_request(body: &Value) -> Result<()> {
     let vector_json = body.get("vector")
         .ok_or_else(|| Error::RustError("Missing 'vector' field".to_string()))?;
     
-    let vector: Vec<f32> = serde_json::from_value(vector_json.clone())
+    let vector = Vec::<f32>::deserialize(vector_json)
         .map_err(|e| Error::RustError(format!("Invalid vector format: {}", e)))?;
     
-    let metadata = body.get("metadata").cloned();
-    
     // Validate each field
     validate_vector_id(id)?;
     validate_vector(&vector)?;
-    validate_metadata(&metadata)?;
+    validate_metadata(body.get("metadata"))?;
     
     Ok(())
 }
@@ -184,7 +198,7 @@ pub fn validate_search_request(body: &Value) -> Result<()> {
     let vector_json = body.get("vector")
         .ok_or_else(|| Error::RustError("Missing 'vector' field".to_string()))?;
     
-    let vector: Vec<f32> = serde_json::from_value(vector_json.clone())
+    let vector = Vec::<f32>::deserialize(vector_json)
         .map_err(|e| Error::RustError(format!("Invalid vector format: {}", e)))?;
     
     let k = body.get("k")
@@ -194,10 +208,63 @@ pub fn validate_search_request(body: &Value) -> Result<()> {
     // Validate
     validate_vector(&vector)?;
     validate_search_k(k)?;
+    SearchInclude::parse(body.get("include"))?;
+    
+    if let Some(cache) = body.get("cache") {
+        if !cache.is_boolean() {
+            return Err(Error::RustError("'cache' must be a boolean".to_string()));
+        }
+    }
     
     Ok(())
 }
 
+/// Optional per-result fields a search can return via `"include"`
+pub const SEARCH_INCLUDE_FIELDS: &[&str] = &["metadata", "vector"];
+
+/// Per-result fields selected by a search's `"include"` list
+///
+/// `id`, `distance` and `score` are always returned. Parsed by the Worker
+/// to reject bad requests early and again by the Durable Object to shape
+/// the response, so both sides accept and reject the same lists.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct SearchInclude {
+    pub metadata: bool,
+    pub vector: bool,
+}
+
+impl SearchInclude {
+    /// Parse the optional `include` list
+    ///
+    /// A missing (or null) list keeps the original response shape:
+    /// metadata, no vector.
+    pub fn parse(include: Option<&Value>) -> Result<Self> {
+        let fields = match include {
+            None | Some(Value::Null) => return Ok(Self { metadata: true, vector: false }),
+            Some(v) => v.as_array()
+                .ok_or_else(|| Error::RustError("'include' must be an array of strings".to_string()))?,
+        };
+        
+        let mut selected = Self { metadata: false, vector: false };
+        for field in fields {
+            match field.as_str() {
+                Some("metadata") => selected.metadata = true,
+                Some("vector") => selected.vector = true,
+                Some(name) => {
+                    return Err(Error::RustError(
+                        format!("Unknown include field '{}' (expected one of: {})", name, SEARCH_INCLUDE_FIELDS.join(", "))
+                    ));
+                }
+                None => {
+                    return Err(Error::RustError("'include' must be an array of strings".to_string()));
+                }
+            }
+        }
+        
+        Ok(selected)
+    }
+}
+
 /// Maximum vectors in a single batch operation
 pub const MAX_BATCH_SIZE: usize = 100;
 
@@ -226,14 +293,123 @@ pub fn validate_batch_insert_request(body: &Value) -> Result<()> {
         let vector_json = item.get("vector")
             .ok_or_else(|| Error::RustError(format!("Missing 'vector' at index {}", i)))?;
         
-        let vector: Vec<f32> = serde_json::from_value(vector_json.clone())
+        let vector = Vec::<f32>::deserialize(vector_json)
             .map_err(|e| Error::RustError(format!("Invalid vector at index {}: {}", i, e)))?;
         
-        let metadata = item.get("metadata").cloned();
-        
         validate_vector_id(id)?;
         validate_vector(&vector)?;
-        validate_metadata(&metadata)?;
+        validate_metadata(item.get("metadata"))?;
+    }
+    
+    Ok(())
+}
+
+/// Validate batch search request body
+///
+/// Shape: `{"queries": [{"vector": [...], "k": 10}, ...]}`
+pub fn validate_batch_search_request(body: &Value) -> Result<()> {
+    let queries = body.get("queries")
+        .and_then(|v| v.as_array())
+        .ok_or_else(|| Error::RustError("Missing or invalid 'queries' array".to_string()))?;
+    
+    if queries.is_empty() {
+        return Err(Error::RustError("Queries array cannot be empty".to_string()));
+    }
+    
+    if queries.len() > MAX_BATCH_SIZE {
+        return Err(Error::RustError(
+            format!("Batch too large (max {} queries)", MAX_BATCH_SIZE)
+        ));
+    }
+    
+    SearchInclude::parse(body.get("include"))?;
+    
+    for (i, query) in queries.iter().enumerate() {
+        validate_search_request(query)
+            .map_err(|e| Error::RustError(format!("Query {}: {}", i, e)))?;
+    }
+    
+    Ok(())
+}
+
+/// Decode a binary vector body
+///
+/// Format: little-endian f32, 4 bytes per dimension, no header.
+/// A 384-dim vector is 1,536 bytes on the wire (vs ~4.6KB as JSON text)
+/// and decodes without any float parsing.
+pub fn decode_binary_vector(bytes: &[u8]) -> Result<Vec<f32>> {
+    if bytes.len() % 4 != 0 {
+        return Err(Error::RustError(
+            format!("Binary vector length must be a multiple of 4 bytes, got {}", bytes.len())
+        ));
+    }
+    
+    Ok(bytes
+        .chunks_exact(4)
+        .map(|b| f32::from_le_bytes([b[0], b[1], b[2], b[3]]))
+        .collect())
+}
+
+/// Decode an int8-quantized vector body
+///
+/// Format: one signed byte per dimension; value = byte × scale.
+/// Clients quantize with a per-vector absmax scale (max|x| / 127), which is
+/// 4x fewer bytes than f32 and keeps cosine recall within ~1% for
+/// normalized embeddings.
+pub fn decode_int8_vector(bytes: &[u8], scale: f32) -> Vec<f32> {
+    bytes.iter().map(|&b| (b as i8) as f32 * scale).collect()
+}
+
+/// Decode a binary vector body according to its `X-Vector-Dtype` header
+///
+/// - `float32` (default): see `decode_binary_vector`
+/// - `int8`: see `decode_int8_vector`; requires `X-Vector-Scale`
+pub fn decode_vector_body(bytes: &[u8], dtype: Option<&str>, scale: Option<&str>) -> Result<Vec<f32>> {
+    match dtype.map(str::trim) {
+        None | Some("float32") => decode_binary_vector(bytes),
+        Some("int8") => {
+            let scale = scale
+                .ok_or_else(|| Error::RustError("int8 vectors require X-Vector-Scale header".to_string()))?;
+            let scale: f32 = scale.trim().parse()
+                .map_err(|_| Error::RustError(format!("Invalid X-Vector-Scale header: {}", scale)))?;
+            if !scale.is_finite() || scale <= 0.0 {
+                return Err(Error::RustError("X-Vector-Scale must be a positive finite number".to_string()));
+            }
+            Ok(decode_int8_vector(bytes, scale))
+        }
+        Some(other) => Err(Error::RustError(
+            format!("Unsupported X-Vector-Dtype: {} (expected float32 or int8)", other)
+        )),
+    }
+}
+
+/// Validate binary insert request
+///
+/// `vector` is the decoded body (see `decode_vector_body`); ID, optional
+/// dimension and optional metadata JSON travel in headers.
+pub fn validate_binary_insert_request(
+    id: &str,
+    vector: &[f32],
+    dimension: Option<&str>,
+    metadata: Option<&str>,
+) -> Result<()> {
+    validate_vector_id(id)?;
+    validate_vector(vector)?;
+    
+    if let Some(dim) = dimension {
+        let dim: usize = dim.trim().parse()
+            .map_err(|_| Error::RustError(format!("Invalid X-Vector-Dim header: {}", dim)))?;
+        if dim != vector.len() {
+            return Err(Error::RustError(
+                format!("X-Vector-Dim is {} but body holds {} values", dim, vector.len())
+            ));
+        }
+    }
+    
+    if let Some(meta) = metadata {
+        let meta: Value = serde_json::from_str(meta)
+            .map_err(|e| Error::RustError(format!("Invalid X-Metadata JSON: {}", e)))?;
+        validate_metadata(Some(&meta))?;
     }
     
     Ok(())
@@ -260,10 +436,75 @@ mod tests {
         assert!(validate_vector(&[f32::INFINITY]).is_err());
     }
     
+    #[test]
+    fn test_validate_metadata() {
+        assert!(validate_metadata(None).is_ok());
+        assert!(validate_metadata(Some(&serde_json::json!({"title": "doc"}))).is_ok());
+        assert!(validate_metadata(Some(&serde_json::json!([1, 2]))).is_err());
+        let big = serde_json::json!({"blob": "x".repeat(MAX_METADATA_SIZE)});
+        assert!(validate_metadata(Some(&big)).is_err());
+    }
+    
     #[test]
     fn test_validate_search_k() {
         assert!(validate_search_k(10).is_ok());
         assert!(validate_search_k(0).is_err());
         assert!(validate_search_k(2000).is_err());
     }
+    
+    #[test]
+    fn test_search_include_parse() {
+        let default = SearchInclude::parse(None).unwrap();
+        assert_eq!(default, SearchInclude { metadata: true, vector: false });
+        assert_eq!(SearchInclude::parse(Some(&Value::Null)).unwrap(), default);
+        
+        let none = SearchInclude::parse(Some(&serde_json::json!([]))).unwrap();
+        assert_eq!(none, SearchInclude { metadata: false, vector: false });
+        
+        let both = SearchInclude::parse(Some(&serde_json::json!(["metadata", "vector"]))).unwrap();
+        assert_eq!(both, SearchInclude { metadata: true, vector: true });
+        
+        assert!(SearchInclude::parse(Some(&serde_json::json!(["payload"]))).is_err());
+        assert!(SearchInclude::parse(Some(&serde_json::json!("metadata"))).is_err());
+        assert!(SearchInclude::parse(Some(&serde_json::json!([1]))).is_err());
+    }
+    
+    #[test]
+    fn test_validate_search_request_cache_flag() {
+        assert!(validate_search_request(&serde_json::json!({"vector": [0.1], "cache": false})).is_ok());
+        assert!(validate_search_request(&serde_json::json!({"vector": [0.1], "cache": "no"})).is_err());
+    }
+    
+    #[test]
+    fn test_validate_batch_search_request() {
+        let ok = serde_json::json!({"queries": [{"vector": [0.1, 0.2], "k": 3}, {"vector": [0.3, 0.4]}]});
+        assert!(validate_batch_search_request(&ok).is_ok());
+        assert!(validate_batch_search_request(&serde_json::json!({"queries": []})).is_err());
+        assert!(validate_batch_search_request(&serde_json::json!({"queries": [{"k": 3}]})).is_err());
+        assert!(validate_batch_search_request(&serde_json::json!({"vector": [0.1]})).is_err());
+    }
+    
+    #[test]
+    fn test_decode_binary_vector() {
+        let bytes: Vec<u8> = [0.5f32, -1.0, 2.25].iter().flat_map(|v| v.to_le_bytes()).collect();
+        assert_eq!(decode_binary_vector(&bytes).unwrap(), vec![0.5, -1.0, 2.25]);
+        assert!(decode_binary_vector(&bytes[..5]).is_err());
+        
+        let vector = decode_vector_body(&bytes, None, None).unwrap();
+        assert!(validate_binary_insert_request("v1", &vector, Some("3"), Some("{\"a\": 1}")).is_ok());
+        assert!(validate_binary_insert_request("v1", &vector, Some("4"), None).is_err());
+        assert!(validate_binary_insert_request("v1", &[], None, None).is_err());
+        assert!(validate_binary_insert_request("v1", &vector, None, Some("[1]")).is_err());
+    }
+    
+    #[test]
+    fn test_decode_int8_vector() {
+        let bytes = [127i8 as u8, 0, (-64i8) as u8];
+        let vector = decode_vector_body(&bytes, Some("int8"), Some("0.5")).unwrap();
+        assert_eq!(vector, vec![63.5, 0.0, -32.0]);
+        
+        assert!(decode_vector_body(&bytes, Some("int8"), None).is_err());
+        assert!(decode_vector_body(&bytes, Some("int8"), Some("-1")).is_err());
+        assert!(decode_vector_body(&bytes, Some("bf16"), None).is_err());
+    }
 }
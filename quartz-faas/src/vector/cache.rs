@@ -0,0 +1,179 @@
+//! Bounded LRU cache for search results
+//!
+//! # Why Cache Queries?
+//!
+//! Search traffic is heavily skewed: a small set of query vectors (popular
+//! questions, dashboard refreshes, retries) accounts for most requests.
+//! Caching the top-k result per (query, k) skips the HNSW traversal
+//! entirely on a repeat query.
+//!
+//! # Design
+//!
+//! - **Exact keys**: f32 bit patterns + k, so only identical queries hit
+//! - **Bounded**: fixed capacity, least-recently-used entry evicted
+//! - **Small entries**: only `(id, distance)` per hit is stored; metadata is
+//!   read from the index when the response is built, so an entry costs a few
+//!   bytes per hit and a cache hit never copies metadata
+//! - **Invalidation**: callers must `clear()` on any index mutation
+//!   (insert, delete, reconfigure) - results are never stale
+//!
+//! Eviction scans for the oldest entry (O(capacity)); with a few hundred
+//! entries this is negligible next to a single HNSW search.
+
+use std::collections::HashMap;
+
+/// Default number of cached queries per index
+pub const DEFAULT_QUERY_CACHE_CAPACITY: usize = 256;
+
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct QueryKey {
+    k: usize,
+    bits: Vec<u32>,
+}
+
+impl QueryKey {
+    fn new(query: &[f32], k: usize) -> Self {
+        Self {
+            k,
+            bits: query.iter().map(|x| x.to_bits()).collect(),
+        }
+    }
+}
+
+/// Ranked `(id, distance)` pairs for one query
+pub type CachedHits = Vec<(String, f32)>;
+
+/// LRU cache of search results keyed by exact query vector and k
+pub struct QueryCache {
+    capacity: usize,
+    /// Monotonic access counter (higher = more recently used)
+    tick: u64,
+    entries: HashMap<QueryKey, (u64, CachedHits)>,
+    hits: u64,
+    misses: u64,
+}
+
+impl QueryCache {
+    /// Create a cache holding at most `capacity` queries (0 disables caching)
+    pub fn new(capacity: usize) -> Self {
+        Self {
+            capacity,
+            tick: 0,
+            entries: HashMap::with_capacity(capacity),
+            hits: 0,
+            misses: 0,
+        }
+    }
+
+    /// Look up cached results, marking the entry as recently used
+    pub fn get(&mut self, query: &[f32], k: usize) -> Option<CachedHits> {
+        self.tick += 1;
+        match self.entries.get_mut(&QueryKey::new(query, k)) {
+            Some((last_used, results)) => {
+                *last_used = self.tick;
+                self.hits += 1;
+                Some(results.clone())
+            }
+            None => {
+                self.misses += 1;
+                None
+            }
+        }
+    }
+
+    /// Store results, evicting the least-recently-used entry when full
+    pub fn insert(&mut self, query: &[f32], k: usize, results: CachedHits) {
+        if self.capacity == 0 {
+            return;
+        }
+
+        let key = QueryKey::new(query, k);
+        if self.entries.len() >= self.capacity && !self.entries.contains_key(&key) {
+            let oldest = self
+                .entries
+                .iter()
+                .min_by_key(|(_, (last_used, _))| *last_used)
+                .map(|(key, _)| key.clone());
+            if let Some(oldest) = oldest {
+                self.entries.remove(&oldest);
+            }
+        }
+
+        self.tick += 1;
+        self.entries.insert(key, (self.tick, results));
+    }
+
+    /// Drop all entries (call after any index mutation)
+    pub fn clear(&mut self) {
+        self.entries.clear();
+    }
+
+    pub fn len(&self) -> usize {
+        self.entries.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.entries.is_empty()
+    }
+
+    /// (hits, misses) since creation
+    pub fn hit_stats(&self) -> (u64, u64) {
+        (self.hits, self.misses)
+    }
+}
+
+impl Default for QueryCache {
+    fn default() -> Self {
+        Self::new(DEFAULT_QUERY_CACHE_CAPACITY)
+    }
+}
+
+// ============================================================================
+// Tests
+// ============================================================================
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn result(id: &str) -> CachedHits {
+        vec![(id.to_string(), 0.0)]
+    }
+
+    #[test]
+    fn test_hit_and_miss() {
+        let mut cache = QueryCache::new(4);
+        assert!(cache.get(&[1.0, 2.0], 5).is_none());
+
+        cache.insert(&[1.0, 2.0], 5, result("a"));
+        assert_eq!(cache.get(&[1.0, 2.0], 5).unwrap()[0].0, "a");
+        assert!(cache.get(&[1.0, 2.0], 10).is_none()); // k is part of the key
+        assert_eq!(cache.hit_stats(), (1, 2));
+    }
+
+    #[test]
+    fn test_evicts_least_recently_used() {
+        let mut cache = QueryCache::new(2);
+        cache.insert(&[1.0], 1, result("a"));
+        cache.insert(&[2.0], 1, result("b"));
+        cache.get(&[1.0], 1); // "a" is now more recent than "b"
+        cache.insert(&[3.0], 1, result("c"));
+
+        assert_eq!(cache.len(), 2);
+        assert!(cache.get(&[1.0], 1).is_some());
+        assert!(cache.get(&[2.0], 1).is_none());
+        assert!(cache.get(&[3.0], 1).is_some());
+    }
+
+    #[test]
+    fn test_clear_and_disabled() {
+        let mut cache = QueryCache::new(2);
+        cache.insert(&[1.0], 1, result("a"));
+        cache.clear();
+        assert!(cache.is_empty());
+
+        let mut disabled = QueryCache::new(0);
+        disabled.insert(&[1.0], 1, result("a"));
+        assert!(disabled.get(&[1.0], 1).is_none());
+    }
+}
@@ -49,7 +49,7 @@ use std::cmp::{Ordering, Reverse};
 use std::collections::{BinaryHeap, HashMap, HashSet};
 
 // Import SIMD-optimized distance functions (4x faster than scalar)
-use super::simd::{cosine_distance_simd, euclidean_distance_simd, dot_product_distance_simd};
+use super::simd::{euclidean_distance_simd, dot_product_distance_simd};
 
 /// Distance metric for vector similarity
 #[derive(Debug, Clone, Copy, Serialize, Deserialize, PartialEq)]
@@ -395,6 +395,24 @@ impl HnswIndex {
         self.vectors.get(id).map(|e| !e.deleted).unwrap_or(false)
     }
 
+    /// Borrow a stored vector without cloning it (or its metadata)
+    ///
+    /// `None` if the ID is missing or soft-deleted.
+    pub fn vector(&self, id: &str) -> Option<&[f32]> {
+        self.vectors.get(id)
+            .filter(|entry| !entry.deleted)
+            .map(|entry| entry.vector.as_slice())
+    }
+
+    /// Borrow a vector's metadata without cloning it
+    ///
+    /// `None` if the ID is missing, soft-deleted, or has no metadata.
+    pub fn metadata(&self, id: &str) -> Option<&serde_json::Value> {
+        self.vectors.get(id)
+            .filter(|entry| !entry.deleted)
+            .and_then(|entry| entry.metadata.as_ref())
+    }
+
     pub fn search(&self, query: &[f32], k: usize) -> Result<Vec<SearchResult>, String> {
         if query.len() != self.dimension {
             return Err(format!("Query dimension mismatch: expected {}, got {}", self.dimension, query.len()));
@@ -747,12 +765,13 @@ impl HnswIndex {
     /// - 4x faster than scalar (200M vs 50M ops/sec)
     /// - Automatically falls back to scalar if SIMD unavailable
     ///
-    /// **Note:** For normalized vectors (cosine), use dot product (cheaper).
+    /// **Note:** Cosine vectors are normalized on insert and query, so the
+    /// cosine case is a plain dot product (no norms, sqrt or divide).
     fn distance(&self, a: &[f32], b: &[f32]) -> f32 {
         match self.metric {
-            // Cosine: 1 - dot(a,b) for normalized vectors
-            // SIMD optimized in cosine_distance_simd (handles both normalized and non-normalized)
-            DistanceMetric::Cosine => cosine_distance_simd(a, b),
+            // Cosine: 1 - dot(a,b) - both sides already unit length
+            // SIMD optimized in dot_product_distance_simd (which returns -dot)
+            DistanceMetric::Cosine => 1.0 + dot_product_distance_simd(a, b),
             
             // Euclidean: sqrt(sum((a[i] - b[i])^2))
             // SIMD optimized in euclidean_distance_simd
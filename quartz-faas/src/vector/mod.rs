@@ -7,9 +7,12 @@
 //! - **SIMD**: 4x faster distance calculations using WASM128
 //! - **Cache-Friendly**: Sequential memory access patterns
 //! - **Adaptive Search**: Early exit when good results found
+//! - **Query Cache**: Repeated queries served without graph traversal
 
+pub mod cache;
 pub mod hnsw;
 pub mod simd;
 
+pub use cache::{CachedHits, QueryCache, DEFAULT_QUERY_CACHE_CAPACITY};
 pub use hnsw::{DistanceMetric, HnswConfig, HnswIndex, SearchResult, VectorEntry, IndexStats};
 pub use simd::{euclidean_distance_simd, cosine_distance_simd, dot_product_distance_simd};
@@ -273,4 +273,15 @@ mod tests {
         let distance = dot_product_distance_simd(&a, &b);
         assert_eq!(distance, -10.0); // -(1+2+3+4)
     }
+
+    #[test]
+    fn test_cosine_matches_dot_on_unit_vectors() {
+        // HNSW relies on this: cosine == 1 + dot_product_distance once normalized
+        let a = vec![0.6, 0.8, 0.0, 0.0, 0.0];
+        let b = vec![0.0, 0.6, 0.0, 0.8, 0.0];
+
+        let cosine = cosine_distance_simd(&a, &b);
+        let via_dot = 1.0 + dot_product_distance_simd(&a, &b);
+        assert!((cosine - via_dot).abs() < 0.0001);
+    }
 }
@@ -22,6 +22,7 @@ while [[ $# -gt 0 ]]; do
     case $1 in
         --verbose|-v) VERBOSE=true; shift ;;
         --timeout|-t) TIMEOUT="$2"; shift 2 ;;
+        --help|-h)    grep -E '^# (Usage|Environment):' "$0" | sed 's/^# //'; exit 0 ;;
         *) shift ;;
     esac
 done
@@ -75,19 +76,32 @@ curl_cmd() {
     curl "${args[@]}" "$@"
 }
 
-# Fast vector generation (precomputed for speed)
+# Value of a response header from `curl -D -` output (case-insensitive name)
+response_header() {
+    tr -d '\r' <<< "$2" | awk -v name="${1,,}" -F': ' 'tolower($1) == name { print $2; exit }'
+}
+
 generate_vector() {
-    local dim=${1:-384}
-    if command -v python3 &>/dev/null; then
-        python3 -c "import random; print('[' + ','.join(f'{random.random():.6f}' for _ in range($dim)) + ']')"
-    else
-        local vec="["
-        for ((i=1; i<=dim; i++)); do
-            vec+="0.$((RANDOM % 1000000))"
-            [[ $i -lt $dim ]] && vec+=","
-        done
-        echo "${vec}]"
-    fi
+    generate_vectors 1 "${1:-384}"
+}
+
+# Batch vector generation: one awk start for the whole batch instead of one
+# per vector. Prints one JSON array per line (use with mapfile). awk starts
+# in ~1ms where a python3 interpreter takes ~50ms. The seed is $SRANDOM
+# (32 random bits, bash 5.1+), or the subshell PID mixed with $RANDOM on
+# older bash, so concurrent or same-second calls differ. It is kept below
+# 2^31 because mawk (Debian/Ubuntu's awk) clamps larger seeds to one value,
+# which made most calls return the same vector.
+generate_vectors() {
+    local seed=$(( ${SRANDOM:-$((BASHPID * 32768 + RANDOM))} % 2147483647 ))
+    awk -v n="${1:-1}" -v d="${2:-384}" -v seed="$seed" 'BEGIN {
+        srand(seed)
+        for (i = 0; i < n; i++) {
+            v = "["
+            for (j = 0; j < d; j++) v = v (j ? "," : "") sprintf("%.6f", rand())
+            print v "]"
+        }
+    }'
 }
 
 #───────────────────────────────────────────────────────────────────────────────
@@ -150,17 +164,18 @@ test_insert() {
     id="quick_test_$(date +%s)"
     
     log_info "Inserting vector: $id"
-    local response
-    response=$(curl_cmd -X POST "$BASE_URL/api/vector/insert" \
+    # Only headers are needed: status line + X-Vector-Id, no JSON to parse
+    local headers
+    headers=$(curl_cmd -D - -o /dev/null -X POST "$BASE_URL/api/vector/insert" \
         -H "Content-Type: application/json" \
         -d "{\"id\": \"$id\", \"vector\": $vector, \"metadata\": {\"test\": true}}" 2>&1)
-    log_debug "Response: $response"
+    log_debug "Headers: $headers"
     
-    if echo "$response" | jq -e '.success == true' &>/dev/null; then
+    if [[ "$(response_header X-Vector-Id "$headers")" == "$id" ]]; then
         log_info "Insert successful"
         return 0
     fi
-    log_info "Insert failed: ${response:0:80}"
+    log_info "Insert failed: $(head -1 <<< "$headers")"
     return 1
 }
 
@@ -228,7 +243,7 @@ test_error_handling() {
     log_info "Testing invalid dimension (2D instead of 384D)..."
     
     local http_code
-    http_code=$(curl_cmd -o /tmp/qtest_err.txt -w "%{http_code}" \
+    http_code=$(curl_cmd -o "$WORK_DIR/error.txt" -w "%{http_code}" \
         -X POST "$BASE_URL/api/vector/insert" \
         -H "Content-Type: application/json" \
         -d '{"id": "invalid", "vector": [0.1, 0.2], "metadata": {}}' 2>&1)
@@ -246,21 +261,24 @@ test_bulk_insert() {
     local count=10 success=0
     local start=$(date +%s%N)
     
-    log_info "Bulk inserting $count vectors..."
+    log_info "Bulk inserting $count vectors (single batch-insert request)..."
     
+    local vectors items="" stamp
+    mapfile -t vectors < <(generate_vectors $count 384)
+    stamp=$(date +%s)
     for i in $(seq 1 $count); do
-        progress $i $count "Vector $i/$count"
-        
-        local vector
-        vector=$(generate_vector 384)
-        local response
-        response=$(curl_cmd -X POST "$BASE_URL/api/vector/insert" \
-            -H "Content-Type: application/json" \
-            -d "{\"id\": \"bulk_$(date +%s)_$i\", \"vector\": $vector, \"metadata\": {\"i\": $i}}" 2>&1)
-        
-        echo "$response" | jq -e '.success == true' &>/dev/null && ((success++))
+        [[ -n "$items" ]] && items+=","
+        items+="{\"id\": \"bulk_${stamp}_$i\", \"vector\": ${vectors[$((i - 1))]}, \"metadata\": {\"i\": $i}}"
     done
-    echo ""
+    
+    local response
+    response=$(curl_cmd -X POST "$BASE_URL/api/vector/batch-insert" \
+        -H "Content-Type: application/json" \
+        -d "{\"vectors\": [$items]}" 2>&1)
+    log_debug "Response: ${response:0:200}"
+    
+    success=$(echo "$response" | jq -r '.inserted // 0' 2>/dev/null)
+    [[ "$success" =~ ^[0-9]+$ ]] || success=0
     
     local end=$(date +%s%N)
     local duration=$(elapsed_ms $((end - start)))
@@ -274,8 +292,22 @@ test_latency() {
     local iterations=5 total_ms=0
     log_info "Measuring latency ($iterations searches)..."
     
-    local vector
-    vector=$(generate_vector 384)
+    local pair
+    mapfile -t pair < <(generate_vectors 2 384)
+    
+    # Constant query: serialize it once, curl streams the file each iteration.
+    # "cache": false keeps every timed request on the HNSW search path
+    # instead of the query cache.
+    local body="$WORK_DIR/query.json"
+    echo "{\"vector\": ${pair[0]}, \"k\": 10, \"include\": [], \"cache\": false}" > "$body"
+    
+    # Throwaway search first so cold-start cost (isolate spin-up, HNSW upper
+    # layers not yet in cache) stays out of the average. The timed requests
+    # send "cache": false, so they run HNSW search rather than hitting the
+    # query cache.
+    curl_cmd -o /dev/null -X POST "$BASE_URL/api/vector/search" \
+        -H "Content-Type: application/json" \
+        -d "{\"vector\": ${pair[1]}, \"k\": 1}" 2>/dev/null
     
     for i in $(seq 1 $iterations); do
         progress $i $iterations "Search $i/$iterations"
@@ -283,12 +315,13 @@ test_latency() {
         local start=$(date +%s%N)
         curl_cmd -X POST "$BASE_URL/api/vector/search" \
             -H "Content-Type: application/json" \
-            -d "{\"vector\": $vector, \"k\": 10}" &>/dev/null
+            --data-binary "@$body" &>/dev/null
         local end=$(date +%s%N)
         
         total_ms=$((total_ms + $(elapsed_ms $((end - start)))))
     done
     echo ""
+    rm -f "$body"
     
     local avg=$((total_ms / iterations))
     log_info "Average latency: ${avg}ms"
@@ -299,6 +332,10 @@ test_latency() {
 # Main
 #═══════════════════════════════════════════════════════════════════════════════
 main() {
+    # Scratch dir for request bodies, removed on exit (including Ctrl-C)
+    WORK_DIR=$(mktemp -d "${TMPDIR:-/tmp}/quartzdb.XXXXXX")
+    trap 'rm -rf "$WORK_DIR"' EXIT
+    
     echo ""
     echo "╔═══════════════════════════════════════════════════════════════════╗"
     echo "║              QuartzDB Quick Test Suite v2.0                       ║"
@@ -312,8 +349,15 @@ main() {
     echo -e "  Verbose:  $VERBOSE"
     echo ""
     
+    # Catches a generator that repeats itself (e.g. an awk that clamps the
+    # srand seed), which would silently turn every insert into a duplicate
+    if [[ "$(generate_vectors 1 8)" == "$(generate_vectors 1 8)" ]]; then
+        log_fail "Vector generator returned the same vector twice"
+        exit 1
+    fi
+    
     log_info "Checking server connectivity..."
-    if ! curl_cmd "$BASE_URL/health" &>/dev/null; then
+    if ! curl_cmd --connect-timeout 3 "$BASE_URL/health" &>/dev/null; then
         log_fail "Server not reachable at $BASE_URL"
         echo -e "  ${DIM}Start server: cd quartz-faas && wrangler dev${NC}"
         exit 1
@@ -326,7 +370,7 @@ main() {
     run_test "Delete Vector" "Soft-delete vector by ID" test_delete
     run_test "Statistics" "Retrieve index statistics" test_stats
     run_test "Error Handling" "Reject invalid dimensions" test_error_handling
-    run_test "Bulk Insert" "Insert 10 vectors with progress" test_bulk_insert
+    run_test "Bulk Insert" "Insert 10 vectors in one batch request" test_bulk_insert
     run_test "Latency Benchmark" "Measure search latency (5x)" test_latency
     
     local total_end=$(date +%s%N)
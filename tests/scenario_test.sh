@@ -15,10 +15,15 @@ set +e
 BASE_URL="${BASE_URL:-http://localhost:8787}"
 API_KEY="${API_KEY:-}"
 TIMEOUT=5
+MAX_JOBS="${MAX_JOBS:-16}"
 SCENARIO="${1:-all}"
 TOTAL_START=$(date +%s%N)
 
 [[ "$1" == "--timeout" || "$2" == "--timeout" ]] && TIMEOUT="${2:-${3:-5}}"
+if [[ "$1" == "--help" || "$1" == "-h" ]]; then
+    grep -E '^# (Usage|Scenarios):' "$0" | sed 's/^# //'
+    exit 0
+fi
 
 #───────────────────────────────────────────────────────────────────────────────
 # Colors
@@ -67,18 +72,30 @@ curl_cmd() {
     curl "${args[@]}" "$@"
 }
 
+# awk starts in ~1ms where a python3 interpreter takes ~50ms. The seed is
+# $SRANDOM (32 random bits, bash 5.1+), or the subshell PID mixed with
+# $RANDOM on older bash, so parallel inserts differ. It is kept below 2^31
+# because mawk (Debian/Ubuntu's awk) clamps larger seeds to one value, which
+# made most calls return the same vector.
 generate_vector() {
-    local dim=${1:-384}
-    if command -v python3 &>/dev/null; then
-        python3 -c "import random; print('[' + ','.join(f'{random.random():.6f}' for _ in range($dim)) + ']')"
-    else
-        local vec="["
-        for ((i=1; i<=dim; i++)); do
-            vec+="0.$((RANDOM % 1000000))"
-            [[ $i -lt $dim ]] && vec+=","
-        done
-        echo "${vec}]"
-    fi
+    local seed=$(( ${SRANDOM:-$((BASHPID * 32768 + RANDOM))} % 2147483647 ))
+    awk -v d="${1:-384}" -v seed="$seed" 'BEGIN {
+        srand(seed)
+        v = "["
+        for (j = 0; j < d; j++) v = v (j ? "," : "") sprintf("%.6f", rand())
+        print v "]"
+    }'
+}
+
+# Scenarios fan inserts out as background jobs (insert_vector ... &) and
+# `wait` before searching, so catalog build time is one round-trip, not N.
+# Jobs spend nearly all their time waiting on curl, so the cap is I/O-sized
+# rather than core-count: MAX_JOBS (default 16) in-flight requests is enough
+# to hide the round-trip without flooding a local wrangler dev server.
+throttle_jobs() {
+    while (( $(jobs -rp | wc -l) >= MAX_JOBS )); do
+        wait -n
+    done
 }
 
 insert_vector() {
@@ -151,8 +168,10 @@ scenario_ecommerce() {
     step "Building product catalog ($count items)..."
     for i in $(seq 1 $count); do
         progress $i $count "Product $i"
-        insert_vector "product_$i" "{\"name\": \"Product $i\", \"price\": $((10 + i * 10)), \"rating\": $(awk -v i=$i 'BEGIN{print 3.5 + (i % 3) * 0.5}')}" >/dev/null
+        throttle_jobs
+        insert_vector "product_$i" "{\"name\": \"Product $i\", \"price\": $((10 + i * 10)), \"rating\": $(awk -v i=$i 'BEGIN{print 3.5 + (i % 3) * 0.5}')}" >/dev/null &
     done
+    wait
     echo ""
     ok "Product catalog created"
     
@@ -187,8 +206,10 @@ scenario_healthcare() {
     step "Indexing medical records ($count cases)..."
     for i in $(seq 0 $((count - 1))); do
         progress $((i + 1)) $count "Case $((i + 1))"
-        insert_vector "case_$i" "{\"summary\": \"${cases[$i]}\", \"severity\": $((1 + i % 3))}" >/dev/null
+        throttle_jobs
+        insert_vector "case_$i" "{\"summary\": \"${cases[$i]}\", \"severity\": $((1 + i % 3))}" >/dev/null &
     done
+    wait
     echo ""
     ok "Medical records indexed"
     
@@ -221,8 +242,10 @@ scenario_finance() {
     for i in $(seq 1 $count); do
         progress $i $count "Transaction $i"
         local is_fraud=$([[ $i -gt 6 ]] && echo 1 || echo 0)
-        insert_vector "txn_$i" "{\"amount\": $((50 + i * 100)), \"is_fraud\": $is_fraud}" >/dev/null
+        throttle_jobs
+        insert_vector "txn_$i" "{\"amount\": $((50 + i * 100)), \"is_fraud\": $is_fraud}" >/dev/null &
     done
+    wait
     echo ""
     ok "Transaction history indexed"
     
@@ -255,8 +278,10 @@ scenario_education() {
     step "Building course catalog ($count courses)..."
     for i in $(seq 0 $((count - 1))); do
         progress $((i + 1)) $count "Course $((i + 1))"
-        insert_vector "course_$i" "{\"title\": \"${courses[$i]}\", \"level\": \"intermediate\", \"hours\": $((10 + i * 5))}" >/dev/null
+        throttle_jobs
+        insert_vector "course_$i" "{\"title\": \"${courses[$i]}\", \"level\": \"intermediate\", \"hours\": $((10 + i * 5))}" >/dev/null &
     done
+    wait
     echo ""
     ok "Course catalog created"
     
@@ -290,8 +315,10 @@ scenario_media() {
     for i in $(seq 1 $count); do
         progress $i $count "Content $i"
         local genre=${genres[$((i % 6))]}
-        insert_vector "content_$i" "{\"title\": \"Movie $i\", \"genre\": \"$genre\", \"rating\": $(awk -v i=$i 'BEGIN{print 6.5 + (i % 4) * 0.7}')}" >/dev/null
+        throttle_jobs
+        insert_vector "content_$i" "{\"title\": \"Movie $i\", \"genre\": \"$genre\", \"rating\": $(awk -v i=$i 'BEGIN{print 6.5 + (i % 4) * 0.7}')}" >/dev/null &
     done
+    wait
     echo ""
     ok "Content library indexed"
     
@@ -322,8 +349,10 @@ scenario_realestate() {
     step "Indexing property listings ($count properties)..."
     for i in $(seq 1 $count); do
         progress $i $count "Property $i"
-        insert_vector "property_$i" "{\"address\": \"$i Main St\", \"price\": $((200000 + i * 50000)), \"bedrooms\": $((2 + i % 4)), \"sqft\": $((1000 + i * 200))}" >/dev/null
+        throttle_jobs
+        insert_vector "property_$i" "{\"address\": \"$i Main St\", \"price\": $((200000 + i * 50000)), \"bedrooms\": $((2 + i % 4)), \"sqft\": $((1000 + i * 200))}" >/dev/null &
     done
+    wait
     echo ""
     ok "Property listings indexed"
     
@@ -360,8 +389,15 @@ main() {
     echo -e "  Scenario: $SCENARIO"
     echo ""
     
+    # Catches a generator that repeats itself (e.g. an awk that clamps the
+    # srand seed), which would silently turn every insert into a duplicate
+    if [[ "$(generate_vector 8)" == "$(generate_vector 8)" ]]; then
+        echo -e "${RED}Vector generator returned the same vector twice${NC}"
+        exit 1
+    fi
+    
     log "Checking server connectivity..."
-    if ! curl_cmd "$BASE_URL/health" &>/dev/null; then
+    if ! curl_cmd --connect-timeout 3 "$BASE_URL/health" &>/dev/null; then
         echo -e "${RED}Server not reachable at $BASE_URL${NC}"
         exit 1
     fi
@@ -21,6 +21,7 @@ while [[ $# -gt 0 ]]; do
     case $1 in
         --verbose|-v) VERBOSE=true; shift ;;
         --timeout|-t) TIMEOUT="$2"; shift 2 ;;
+        --help|-h)    grep -E '^# (Usage|Environment):' "$0" | sed 's/^# //'; exit 0 ;;
         *) shift ;;
     esac
 done
@@ -63,18 +64,32 @@ curl_cmd() {
     curl "${args[@]}" "$@"
 }
 
+# Value of a response header from `curl -D -` output (case-insensitive name)
+response_header() {
+    tr -d '\r' <<< "$2" | awk -v name="${1,,}" -F': ' 'tolower($1) == name { print $2; exit }'
+}
+
 generate_vector() {
-    local dim=${1:-384}
-    if command -v python3 &>/dev/null; then
-        python3 -c "import random; print('[' + ','.join(f'{random.random():.6f}' for _ in range($dim)) + ']')"
-    else
-        local vec="["
-        for ((i=1; i<=dim; i++)); do
-            vec+="0.$((RANDOM % 1000000))"
-            [[ $i -lt $dim ]] && vec+=","
-        done
-        echo "${vec}]"
-    fi
+    generate_vectors 1 "${1:-384}"
+}
+
+# Batch vector generation: one awk start for the whole batch instead of one
+# per vector. Prints one JSON array per line (use with mapfile). awk starts
+# in ~1ms where a python3 interpreter takes ~50ms. The seed is $SRANDOM
+# (32 random bits, bash 5.1+), or the subshell PID mixed with $RANDOM on
+# older bash, so concurrent or same-second calls differ. It is kept below
+# 2^31 because mawk (Debian/Ubuntu's awk) clamps larger seeds to one value,
+# which made most calls return the same vector.
+generate_vectors() {
+    local seed=$(( ${SRANDOM:-$((BASHPID * 32768 + RANDOM))} % 2147483647 ))
+    awk -v n="${1:-1}" -v d="${2:-384}" -v seed="$seed" 'BEGIN {
+        srand(seed)
+        for (i = 0; i < n; i++) {
+            v = "["
+            for (j = 0; j < d; j++) v = v (j ? "," : "") sprintf("%.6f", rand())
+            print v "]"
+        }
+    }'
 }
 
 #───────────────────────────────────────────────────────────────────────────────
@@ -85,10 +100,11 @@ test_ecommerce() {
     echo ""
     
     step "Inserting 5 product vectors..."
+    local vectors
+    mapfile -t vectors < <(generate_vectors 5 384)
     for i in $(seq 1 5); do
         progress $i 5 "Product $i"
-        local vector
-        vector=$(generate_vector 384)
+        local vector="${vectors[$((i - 1))]}"
         curl_cmd -X POST "$BASE_URL/api/vector/insert" \
             -H "Content-Type: application/json" \
             -d "{\"id\": \"smoke_product_$i\", \"vector\": $vector, \"metadata\": {\"name\": \"Product $i\", \"price\": $((i * 10))}}" >/dev/null
@@ -122,10 +138,11 @@ test_documents() {
     echo ""
     
     step "Inserting 3 document vectors..."
+    local vectors
+    mapfile -t vectors < <(generate_vectors 3 384)
     for i in $(seq 1 3); do
         progress $i 3 "Document $i"
-        local vector
-        vector=$(generate_vector 384)
+        local vector="${vectors[$((i - 1))]}"
         curl_cmd -X POST "$BASE_URL/api/vector/insert" \
             -H "Content-Type: application/json" \
             -d "{\"id\": \"smoke_doc_$i\", \"vector\": $vector, \"metadata\": {\"title\": \"Document $i\"}}" >/dev/null
@@ -161,12 +178,12 @@ test_lifecycle() {
     step "Insert test document..."
     local vector
     vector=$(generate_vector 384)
-    local insert_result
-    insert_result=$(curl_cmd -X POST "$BASE_URL/api/vector/insert" \
+    local insert_headers
+    insert_headers=$(curl_cmd -D - -o /dev/null -X POST "$BASE_URL/api/vector/insert" \
         -H "Content-Type: application/json" \
         -d "{\"id\": \"$test_id\", \"vector\": $vector, \"metadata\": {\"test\": true}}")
     
-    if ! echo "$insert_result" | jq -e '.success == true' &>/dev/null; then
+    if [[ "$(response_header X-Vector-Id "$insert_headers")" != "$test_id" ]]; then
         err "Insert failed"
         return 1
     fi
@@ -186,13 +203,22 @@ test_lifecycle() {
     local delete_result
     delete_result=$(curl_cmd -X DELETE "$BASE_URL/api/vector/delete/$test_id")
     
-    if echo "$delete_result" | grep -qi "success\|deleted"; then
-        ok "Document deleted"
-        return 0
-    else
+    if ! echo "$delete_result" | grep -qi "success\|deleted"; then
         err "Delete failed"
         return 1
     fi
+    ok "Document deleted"
+    
+    step "Verify document is gone..."
+    # HEAD returns only the status line - no vector or error body to fetch
+    local status
+    status=$(curl_cmd -I -o /dev/null -w '%{http_code}' "$BASE_URL/api/vector/get/$test_id")
+    if [[ "$status" == "404" ]]; then
+        ok "Document no longer retrievable"
+        return 0
+    fi
+    err "Document still retrievable after delete (HTTP $status)"
+    return 1
 }
 
 #───────────────────────────────────────────────────────────────────────────────
@@ -225,19 +251,29 @@ test_performance() {
     echo ""
     
     step "Measuring search latency (10 searches)..."
-    local vector total_ms=0
-    vector=$(generate_vector 384)
+    local pair total_ms=0
+    mapfile -t pair < <(generate_vectors 2 384)
+    
+    # Bypass the query cache so repeats of the same query measure HNSW search
+    local body="$WORK_DIR/query.json"
+    echo "{\"vector\": ${pair[0]}, \"k\": 10, \"cache\": false}" > "$body"
+    
+    # Warm-up search, excluded from the average
+    curl_cmd -X POST "$BASE_URL/api/vector/search" \
+        -H "Content-Type: application/json" \
+        -d "{\"vector\": ${pair[1]}, \"k\": 1}" >/dev/null
     
     for i in $(seq 1 10); do
         progress $i 10 "Search $i"
         local start=$(date +%s%N)
         curl_cmd -X POST "$BASE_URL/api/vector/search" \
             -H "Content-Type: application/json" \
-            -d "{\"vector\": $vector, \"k\": 10}" >/dev/null
+            --data-binary "@$body" >/dev/null
         local end=$(date +%s%N)
         total_ms=$((total_ms + $(elapsed_ms $((end - start)))))
     done
     echo ""
+    rm -f "$body"
     
     local avg=$((total_ms / 10))
     
@@ -256,6 +292,10 @@ test_performance() {
 # Main
 #═══════════════════════════════════════════════════════════════════════════════
 main() {
+    # Scratch dir for request bodies, removed on exit (including Ctrl-C)
+    WORK_DIR=$(mktemp -d "${TMPDIR:-/tmp}/quartzdb.XXXXXX")
+    trap 'rm -rf "$WORK_DIR"' EXIT
+    
     echo ""
     echo "╔═══════════════════════════════════════════════════════════════════╗"
     echo "║              QuartzDB Smoke Test Suite v2.0                       ║"
@@ -268,8 +308,15 @@ main() {
     echo -e "  API Key:  ${API_KEY:+${API_KEY:0:8}...}${API_KEY:-none}"
     echo ""
     
+    # Catches a generator that repeats itself (e.g. an awk that clamps the
+    # srand seed), which would silently turn every insert into a duplicate
+    if [[ "$(generate_vectors 1 8)" == "$(generate_vectors 1 8)" ]]; then
+        echo -e "${RED}Vector generator returned the same vector twice${NC}"
+        exit 1
+    fi
+    
     log "Checking server connectivity..."
-    if ! curl_cmd "$BASE_URL/health" &>/dev/null; then
+    if ! curl_cmd --connect-timeout 3 "$BASE_URL/health" &>/dev/null; then
         echo -e "${RED}Server not reachable at $BASE_URL${NC}"
         exit 1
     fi